@@ -13,19 +13,24 @@ import re
 import sys
 
 # Constants
-NUM_BYTES = (1024 ** 2) * 100  # 100MB of characters
 HEIGHT = 8
 WIDTH = 8
 STRENGTH = 9
 CELL_WIDTH = 11
+TRAVEL_STEPS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))  # Includes staying put
+ADJACENT_OFFSETS = ((1, 1), (1, 0), (1, -1), (0, 1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+COORDS_PATTERN = re.compile(r"\(?(-?\d+)[, ]+(-?\d+)\)?")  # Matches "x,y", "(x, y)" or "x y"
 
 # ANSI Colors for console output
 ANSI_CYAN = "\033[96m"
 ANSI_END = "\033[0m"
 ANSI_GREEN = "\033[92m"
 ANSI_RED = "\033[91m"
+STRENGTH_LABELS = tuple(ANSI_RED + str(i) + ANSI_END for i in range(STRENGTH + 1))  # Indexed by strength
 
 class Alien:
+    __slots__ = ('board', 'coords', 'strength', 'x', 'y', 'squished', 'children')
+
     def __init__(self, board, coords, strength):
         self.board = board
         self.coords = coords
@@ -34,11 +39,12 @@ class Alien:
         self.x = coords[0]
         self.y = coords[1]
         self.squished = False
-        self.value = bytearray(NUM_BYTES)  # Each alien takes up a large amount of memory
         self.children = []
 
     def __str__(self):
-        return ANSI_RED + str(self.strength) + ANSI_END
+        if 0 <= self.strength <= STRENGTH:
+            return STRENGTH_LABELS[self.strength]
+        return ANSI_RED + str(self.strength) + ANSI_END  # Popped below zero
 
     def doDeath(self):
         # Marks this alien as squished and clears its cell on the board. 
@@ -48,14 +54,16 @@ class Alien:
     def doPop(self, strength=1):
         # Reduces the alien's strength; marks it as squished if strength falls below 1.
         self.strength -= strength
+        self.board.total_strength -= strength
         if self.strength < 1:
             self.doDeath()
 
     def doGrow(self):
         # Randomly increases the alien's strength if it is below the max strength.
-        chance = random.randint(0, 9)
-        if self.strength < STRENGTH and chance > 7:
+        # The strength check comes first so maxed out aliens skip the roll
+        if self.strength < STRENGTH and random.randrange(10) > 7:
             self.strength += 1
+            self.board.total_strength += 1
 
     def doTimestep(self):
         # Simulates time steps for the alien
@@ -65,48 +73,37 @@ class Alien:
 
     def doTravel(self):
         # Randomly moves the alien if possible
-        distx = random.randint(-1, 1)
-        disty = random.randint(-1, 1)
+        distx, disty = random.choice(TRAVEL_STEPS)
+        if distx == 0 and disty == 0:
+            return  # Staying put, nothing to move
         newx = self.x + distx
         newy = self.y + disty
         if self.inRange((newx, newy)):
             self.board.moveAlien(self.coords, (newx, newy))
-            self.coords = (newx, newy)
     
     def doSpawn(self):
-        # Spawns a new alien in an adjacent empty cell 
-        emptySpace = self.findEmptySpace()
-        neighbor = self.getNeighbor()
-        chance = random.randint(0, 9)
-        if neighbor is not None and emptySpace is not None and chance > 6:
-            child = Alien(self.board, emptySpace, max(1, self.strength - 1))
+        # Spawns a new alien in an adjacent empty cell, but only next to another alien.
+        # A single pass over the neighbourhood finds both the empty cells and any neighbor.
+        chance = random.randrange(10)
+        if chance <= 6:
+            return  # Roll first so the neighbourhood is only searched when a spawn can happen
+        emptySpaces = []
+        hasNeighbor = False
+        for coords in self.adjacentCells():
+            if self.board.isEmpty(coords):
+                emptySpaces.append(coords)
+            else:
+                hasNeighbor = True
+        if hasNeighbor and emptySpaces:
+            child = Alien(self.board, random.choice(emptySpaces), max(1, self.strength - 1))
             self.children.append(child)
 
-    def findEmptySpace(self):
-        # Finds an adjacent empty space to the alien for spawning.
-        adjacent = [(self.x + 1, self.y + 1), (self.x + 1, self.y), (self.x + 1, self.y - 1),
-                    (self.x, self.y + 1), (self.x, self.y - 1), (self.x - 1, self.y - 1),
-                    (self.x - 1, self.y), (self.x - 1, self.y + 1)]
-        random.shuffle(adjacent)
-        for coords in adjacent:
-            if self.inRange(coords) and self.board.isEmpty(coords):
-               return coords
-        return None
-
-    def getNeighbor(self):
-        # Finds a random adjacent alien. 
-        adjacent = [(self.x + 1, self.y + 1), (self.x + 1, self.y), (self.x + 1, self.y - 1),
-                    (self.x, self.y + 1), (self.x, self.y - 1), (self.x - 1, self.y - 1),
-                    (self.x - 1, self.y), (self.x - 1, self.y + 1)]
-        neighbors = []
-        for coords in adjacent:
+    def adjacentCells(self):
+        # Yields the coordinates of the in-range cells surrounding the alien.
+        for dx, dy in ADJACENT_OFFSETS:
+            coords = (self.x + dx, self.y + dy)
             if self.inRange(coords):
-                neighbor = self.board.getAlien(coords)
-                if neighbor is not None:
-                    neighbors.append(neighbor)
-        if not neighbors:
-            return None
-        return neighbors[random.randint(0, len(neighbors) - 1)]
+                yield coords
 
     def inRange(self, coords):
         # Error checking of the boundaries
@@ -114,56 +111,69 @@ class Alien:
 
 class Board:
     def __init__(self, height, width):
-        self.board = [[None for _ in range(width)] for _ in range(height)]
+        self.board = [[None] * height for _ in range(width)]  # Indexed as board[x][y]
         self.height = height
         self.width = width
+        self.occupied = 0  # Number of cells currently holding an alien
+        self.total_strength = 0  # Sum of the strengths of all aliens on the board
+        self.live_aliens = {}  # Aliens on the board, used as an insertion-ordered set
         self.player = None  # Reference to the player
+        self.separator = '-' * ((height * CELL_WIDTH) + 1)  # Line drawn between rendered rows
 
     def __str__(self):
         
-        string = ""
+        lines = []
         for i in range(self.width):
             cells1 = []
             cells2 = []
             for j in range(self.height):
                 alien = self.getAlien((i, j))
-                cell1 = "|    -     "
                 if alien is not None and not alien.squished:
-                    cell1 = "|    {0}     ".format(alien)
-                cell2 = "| ({0:02d},{1:02d})  ".format(i, j)
-                if j == (self.height - 1):
-                    cell1 += '|'
-                    cell2 += '|'
-                cells1.append(cell1)
-                cells2.append(cell2)
-            string += '-' * ((len(cells1) * CELL_WIDTH) + 1)
-            string += '\n'
-            for cell in cells1:
-                string += cell
-            string += '\n'
-            for cell in cells2:
-                string += cell
-            string += '\n'
-            if i == (self.width - 1):
-                string += '-' * ((len(cells1) * CELL_WIDTH) + 1)
-                string += '\n'
-        return string
+                    cells1.append(f"|    {alien}     ")
+                else:
+                    cells1.append("|    -     ")
+                cells2.append(f"| ({i:02d},{j:02d})  ")
+            lines.append(self.separator)
+            lines.append("".join(cells1) + '|')
+            lines.append("".join(cells2) + '|')
+        lines.append(self.separator)
+        return "\n".join(lines) + "\n"
 
     def addAlien(self, alien):
         # Adds an alien to the board at its current coordinates.
+        current = self.board[alien.coords[0]][alien.coords[1]]
+        if current is None:
+            self.occupied += 1
+        else:
+            self.total_strength -= current.strength
+            self.live_aliens.pop(current, None)
+        self.total_strength += alien.strength
         self.board[alien.coords[0]][alien.coords[1]] = alien
+        self.live_aliens[alien] = None
+
+    def clear(self):
+        # Squishes every alien and empties the whole board in one go.
+        for alien in self.live_aliens:
+            alien.squished = True
+        self.board = [[None] * self.height for _ in range(self.width)]
+        self.live_aliens.clear()
+        self.occupied = 0
+        self.total_strength = 0
 
     def clearCell(self, coords):
         # Clears the cell at the given coordinates. 
+        alien = self.board[coords[0]][coords[1]]
+        if alien is not None:
+            self.occupied -= 1
+            self.total_strength -= alien.strength
+            self.live_aliens.pop(alien, None)
         self.board[coords[0]][coords[1]] = None
 
     def doTimestep(self):
-        # Time step simulation.
-        for i in range(self.width):
-            for j in range(self.height):
-                alien = self.getAlien((i, j))
-                if alien is not None and not alien.squished:
-                    alien.doTimestep()
+        # Time step simulation. Iterates over a snapshot since aliens may spawn or die mid-step.
+        for alien in list(self.live_aliens):
+            if not alien.squished:
+                alien.doTimestep()
 
     def getAlien(self, coords):
         # Returns the alien at the given coordinates, or None if empty. 
@@ -172,16 +182,21 @@ class Board:
     def isEmpty(self, coords=None):
         # Checks if the specified cell or the entire board is empty. 
         if coords is None:
-            return all(self.getAlien((i, j)) is None for i in range(self.width) for j in range(self.height))
+            return self.occupied == 0
         else:
             return self.getAlien(coords) is None
 
+    def isFull(self):
+        # Checks if every cell on the board holds an alien.
+        return self.occupied == self.width * self.height
+
     def moveAlien(self, oldCoords, newCoords):
         # Moves an alien from oldCoords to newCoords. 
-        if not self.isEmpty(oldCoords) and self.isEmpty(newCoords):
-            alien = self.getAlien(oldCoords)
-            self.clearCell(oldCoords)
+        alien = self.board[oldCoords[0]][oldCoords[1]]
+        if alien is not None and self.board[newCoords[0]][newCoords[1]] is None:
+            self.board[oldCoords[0]][oldCoords[1]] = None
             self.board[newCoords[0]][newCoords[1]] = alien
+            alien.coords = newCoords
             alien.x, alien.y = newCoords[0], newCoords[1]
 
     def squish(self, coords, strength=1):
@@ -189,25 +204,25 @@ class Board:
         if not (0 <= coords[0] < self.width and 0 <= coords[1] < self.height):
             print("Invalid coordinates. Lose your turn.")
             return -1
-        elif self.isEmpty(coords):
+        alien = self.getAlien(coords)
+        if alien is None:
             print("Cell is empty. Lose your turn.")
             return -1
+        player = self.player
+        score = min(strength, alien.strength)
+        alien.doPop(strength)
+        if score > 0:
+            player.consecutive_hits += 1
+            if player.consecutive_hits >= 5: # Condition to use the radius bomb feature
+                player.trigger_bomb(coords)  # Trigger the radius bomb after 5 hits
+                player.consecutive_hits = 0
         else:
-            alien = self.getAlien(coords)
-            if alien is not None:
-                score = strength if alien.strength > strength else alien.strength
-                alien.doPop(strength)
-                if score > 0:
-                    self.player.consecutive_hits += 1
-                    if self.player.consecutive_hits >= 5: # Condition to use the radius bomb feature
-                        self.player.trigger_bomb(coords)  # Trigger the radius bomb after 5 hits
-                        self.player.consecutive_hits = 0
-                else:
-                    self.player.consecutive_hits = 0
-                return score
-        return -1
+            player.consecutive_hits = 0
+        return score
 
 class Player:
+    __slots__ = ('board', 'score', 'strength', 'turn', 'consecutive_hits')
+
     def __init__(self, board, troops, bombs):
         self.board = board
         self.score = 0
@@ -217,8 +232,8 @@ class Player:
 
     def __str__(self):
     
-        width = self.board.width
-        size = (width * CELL_WIDTH) + 1
+        cells = self.board.height  # Each rendered row holds one cell per y
+        size = (cells * CELL_WIDTH) + 1
         string = "TURN: {0}\tSTRENGTH: {1}\tSCORE: ".format(self.turn, self.strength)
         if self.score > 0:
             string += ANSI_GREEN + str(self.score) + ANSI_END
@@ -236,26 +251,30 @@ class Player:
 
         # Triggers a radius bomb that affects all aliens within a 1-block radius around the epicenter. 
 
-        bomb_range = range(-1, 2)  # This creates a range from -1 to 1
-        affected_cells = [(epicenter[0] + dx, epicenter[1] + dy) for dx in bomb_range for dy in bomb_range
-                      if 0 <= epicenter[0] + dx < WIDTH and 0 <= epicenter[1] + dy < HEIGHT]
+        # Slicing clips the 3x3 blast area to the board edges
+        x, y = epicenter
+        affected_rows = [row[max(0, y - 1):y + 2] for row in self.board.board[max(0, x - 1):x + 2]]
+        affected_count = sum(len(row) for row in affected_rows)
     
-        print(f"Triggering bomb at {epicenter} affecting {len(affected_cells)} cells")
-        for (x, y) in affected_cells:
-            alien = self.board.getAlien((x, y))
-            if alien:
-                alien.doDeath()
+        print(f"Triggering bomb at {epicenter} affecting {affected_count} cells")
+        for row in affected_rows:
+            for alien in row:
+                if alien:
+                    alien.doDeath()
 
 
 def printTree(alien, depth=0):
 
-    tree = "{0}({1}):".format(str(alien), depth)
-    if len(alien.children) == 0:
-        return tree
-    else:
-        for child in alien.children:
-            tree += printTree(child, depth + 1)
-    return tree
+    # Walks the spawn tree depth first with an explicit stack so deep trees can't hit the
+    # recursion limit. Squished children are pruned here rather than on every garbage collection pass
+    parts = []
+    stack = [(alien, depth)]
+    while stack:
+        current_alien, current_depth = stack.pop()
+        current_alien.children = [child for child in current_alien.children if not child.squished]
+        parts.append("{0}({1}):".format(str(current_alien), current_depth))
+        stack.extend((child, current_depth + 1) for child in reversed(current_alien.children))
+    return "".join(parts)
 
 def printTrees(aliens):
 
@@ -265,42 +284,17 @@ def printTrees(aliens):
 
 def garbage_collect(aliens):
 
-    # Iteratively mark and sweep garbage collection to remove references to squished aliens.
+    # Removes references to squished aliens. Only the roots are tracked here, so a single
+    # pass is enough; squished children are dropped lazily when the trees are printed.
 
-    for root_alien in aliens:
-        if root_alien.squished:
-            continue  # Skip entirely squished roots early
-
-        stack = [(root_alien, None, 0)]  # Stack holds tuples of (alien, parent, index_in_parent)
-        while stack:
-            current_alien, parent, idx = stack.pop()
-
-            if current_alien.squished:
-                # If current alien is squished, remove it from its parent
-                if parent is not None:
-                    parent.children[idx] = None
-            else:
-                # Push children to stack, remember parent and index
-                for i, child in enumerate(current_alien.children):
-                    stack.append((child, current_alien, i))
-
-        # Filter out and clean squished aliens
-        if not root_alien.squished:
-            root_alien.children = [child for child in root_alien.children if child is not None]
-
-    # Return all non-squished aliens
-    return [alien for alien in aliens if not alien.squished and alien.children or not alien.squished]
+    return [alien for alien in aliens if not alien.squished]
 
 def nuke_board(board):
     
     # Clears all aliens from the board. This function represents the nuke effect
     # used when the player's strength is greater than all remaining aliens' strength on the board
 
-    for i in range(board.width):
-        for j in range(board.height):
-            alien = board.getAlien((i, j))
-            if alien:
-                alien.doDeath()
+    board.clear()
 
 if __name__ == "__main__":
     seed = 0
@@ -315,14 +309,13 @@ if __name__ == "__main__":
     userin = ""
     
     while(userin.upper() != "QUIT" and userin.upper() != "EXIT"):
-        if all(not board.isEmpty((x, y)) for x in range(WIDTH) for y in range(HEIGHT)):
+        if board.isFull():
             print("Game over! The board is full of aliens.")  # Losing condition
             break
         
         if player.turn > 5:  # Check the winning condition only after 5 turns
-            # Calculate the sum of strengths of all non-squished aliens
-            alive_aliens = [alien for row in board.board for alien in row if alien is not None and not alien.squished]
-            total_alien_strength = sum(alien.strength for alien in alive_aliens)
+            # Sum of strengths of all non-squished aliens, kept up to date by the board
+            total_alien_strength = board.total_strength
             
             # Check the winning condition based on the sum of alien strengths
             if total_alien_strength < player.strength:
@@ -344,19 +337,19 @@ if __name__ == "__main__":
         print(player)
         
         userin = input("Choose a coordinate to attack (x,y): ")
-        search = re.search(r"\(?(-?\d+)[, ]+(-?\d+)\)?", userin)
-        (userx, usery) = search.groups() if search else (None, None)
-        
-        if userx is None or usery is None:
-            if userin.upper() in ["QUIT", "EXIT"]:
-                continue
-            elif userin.upper() == "TREES":
-                printTrees(aliens)
-                continue
+        command = userin.upper()
+        if command in ("QUIT", "EXIT"):
+            continue
+        elif command == "TREES":
+            printTrees(aliens)
+            continue
+
+        search = COORDS_PATTERN.search(userin)
+        if search is None:
             print("Invalid coordinates. Lose your turn.")
         else:
-            userx = int(userx)
-            usery = int(usery)
+            userx = int(search.group(1))
+            usery = int(search.group(2))
             score = board.squish((userx, usery), player.strength)
             if score > 0:
                 player.strength += 1 if player.strength < STRENGTH else 0